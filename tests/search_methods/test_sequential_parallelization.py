@@ -1,9 +1,10 @@
 from tiralib.search_methods.sequential_parallelization import (
     parallelize_first_legal_outermost,
 )
+from tiralib.tiramisu.schedule import Schedule
 from tiralib.tiramisu.tiramisu_actions.parallelization import Parallelization
 from tiralib.config import BaseConfig
-from tests.utils import benchmark_program_test_sample
+from tests.utils import benchmark_program_test_sample, multiple_roots_sample
 
 
 def test_sequential_parallelization():
@@ -14,3 +15,28 @@ def test_sequential_parallelization():
     optim = schedule.optims_list[0]
     assert isinstance(optim, Parallelization)
     assert optim.iterator_id == ("comp02", 0)
+
+
+def test_sequential_parallelization_multiple_roots():
+    BaseConfig.init()
+    test_program = multiple_roots_sample()
+    tree = test_program.tree
+
+    # the first candidate of each root that is legal on its own
+    expected_iterators = []
+    candidates_per_root = Parallelization.get_candidates(tree)
+    for root in tree.roots:
+        for candidate in candidates_per_root[tree.iterators[root].id]:
+            tmp_schedule = Schedule(test_program)
+            tmp_schedule.add_optimizations(
+                [Parallelization(params=[node]) for node in candidate]
+            )
+            if tmp_schedule.is_legal():
+                expected_iterators.extend(candidate)
+                break
+
+    schedule = parallelize_first_legal_outermost(test_program)
+
+    assert expected_iterators
+    assert schedule is not None
+    assert [optim.iterator_id for optim in schedule.optims_list] == expected_iterators
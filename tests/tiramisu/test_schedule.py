@@ -103,6 +103,51 @@ def test_is_legal():
     assert legality is True
 
 
+def test_batch_is_legal():
+    BaseConfig.init()
+    test_program = benchmark_program_test_sample()
+
+    schedule = Schedule(test_program)
+    assert schedule.tree
+
+    legalities = schedule.batch_is_legal(
+        [
+            [Parallelization(params=[("comp02", 0)])],
+            [Parallelization(params=[("comp02", 2)])],
+        ]
+    )
+
+    assert legalities == [True, False]
+    assert not schedule.optims_list
+
+    # several roots and computations, the batch must agree with the
+    # variants checked one by one
+    test_program = test_utils.multiple_roots_sample()
+    schedule = Schedule(test_program)
+    assert schedule.tree
+
+    candidates = Parallelization.get_candidates(schedule.tree)
+    nodes = [
+        node
+        for root_candidates in candidates.values()
+        for candidate in root_candidates
+        for node in candidate
+    ]
+
+    legalities = schedule.batch_is_legal(
+        [[Parallelization(params=[node])] for node in nodes]
+    )
+
+    expected_legalities = []
+    for node in nodes:
+        variant_schedule = schedule.copy()
+        variant_schedule.add_optimizations([Parallelization(params=[node])])
+        expected_legalities.append(variant_schedule.is_legal())
+
+    assert legalities == expected_legalities
+    assert not schedule.optims_list
+
+
 def test_copy():
     BaseConfig.init()
     original = Schedule(benchmark_program_test_sample())
@@ -115,6 +160,7 @@ def test_copy():
     assert original is not copy
     assert original.tiramisu_program is copy.tiramisu_program
     assert original.optims_list is not copy.optims_list
+    assert original.tree is copy.tree
     assert len(original.optims_list) == len(copy.optims_list)
     for optim in original.optims_list:
         assert optim in copy.optims_list
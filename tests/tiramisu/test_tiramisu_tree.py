@@ -1,3 +1,5 @@
+import copy
+
 import tests.utils as test_utils
 from tiralib.tiramisu.tiramisu_tree import TiramisuTree
 from tiralib.config import BaseConfig
@@ -58,6 +60,49 @@ def test_get_candidate_computations():
     ]
 
 
+def test_memoized_traversals():
+    t_tree = test_utils.tree_test_sample()
+
+    # mutating the returned values must not corrupt the memoized results
+    comps = t_tree.get_iterator_subtree_computations(("comp01", 0))
+    comps.append("comp05")
+    assert t_tree.get_iterator_subtree_computations(("comp01", 0)) == [
+        "comp01",
+        "comp03",
+        "comp04",
+    ]
+
+    sections = t_tree.get_candidate_sections()
+    sections[("comp01", 0)].pop()
+    assert len(t_tree.get_candidate_sections()[("comp01", 0)]) == 5
+
+    # mutating the tree in place requires invalidating the caches
+    t_tree.iterators[("comp01", 1)].computations_list.append("comp02")
+    t_tree.invalidate_caches()
+    assert t_tree.get_iterator_subtree_computations(("comp01", 0)) == [
+        "comp01",
+        "comp02",
+        "comp03",
+        "comp04",
+    ]
+
+    # copies do not share the tree structure nor the memoized results
+    tree_copy = copy.deepcopy(t_tree)
+    tree_copy.iterators[("comp01", 1)].computations_list.remove("comp02")
+    tree_copy.invalidate_caches()
+    assert tree_copy.get_iterator_subtree_computations(("comp01", 0)) == [
+        "comp01",
+        "comp03",
+        "comp04",
+    ]
+    assert t_tree.get_iterator_subtree_computations(("comp01", 0)) == [
+        "comp01",
+        "comp02",
+        "comp03",
+        "comp04",
+    ]
+
+
 def test_get_root_of_node():
     t_tree = test_utils.tree_test_sample()
 
@@ -1,4 +1,5 @@
 import tests.utils as test_utils
+from tiralib.tiramisu.compiling_service import CompilingService
 from tiralib.tiramisu.schedule import Schedule
 from tiralib.tiramisu.tiramisu_actions.skewing import Skewing
 from tiralib.config import BaseConfig
@@ -50,15 +51,98 @@ def test_get_candidates():
     candidates = Skewing.get_candidates(tree)
     assert candidates == {("comp01", 0): [(("comp03", 1), ("comp03", 2))]}
 
+    candidates = Skewing.get_candidates(tree, already_parallel={("comp03", 1)})
+    assert candidates == {("comp01", 0): []}
 
-def test_get_factors():
+    # skewing a loop with a single iteration is degenerate
+    tree.iterators[("comp03", 2)].upper_bound = 1
+    candidates = Skewing.get_candidates(tree)
+    assert candidates == {("comp01", 0): []}
+
+
+def test_get_factors(monkeypatch):
     BaseConfig.init()
+    CompilingService._skewing_solver_cache.clear()
     sample = test_utils.skewing_example()
     loop_levels = sample.tree.get_iterator_levels([("comp00", 0), ("comp00", 1)])
+    inner_loop_levels = sample.tree.get_iterator_levels([("comp00", 1), ("comp00", 2)])
     schedule = Schedule(sample)
-    factors = Skewing.get_factors(
+
+    # two requests missing from the memoized solutions, solved by a single
+    # program
+    factors = CompilingService.call_skewing_solver_batch(
+        schedule, [(loop_levels, ["comp00"]), (inner_loop_levels, ["comp00"])]
+    )
+    assert len(factors) == 2
+    assert factors[0] == (1, 1)
+    assert len(CompilingService._skewing_solver_cache) == 2
+
+    # the solution of the second request matches the one of a single request
+    CompilingService._skewing_solver_cache.clear()
+    assert (
+        CompilingService.call_skewing_solver(schedule, inner_loop_levels, ["comp00"])
+        == factors[1]
+    )
+
+    # the solved requests are answered without running the solver
+    CompilingService.call_skewing_solver(schedule, loop_levels, ["comp00"])
+
+    def fail_run_cpp_code(*args, **kwargs):
+        raise AssertionError("the skewing solver should not run")
+
+    monkeypatch.setattr(CompilingService, "run_cpp_code", fail_run_cpp_code)
+
+    assert (
+        CompilingService.call_skewing_solver_batch(
+            schedule, [(loop_levels, ["comp00"]), (inner_loop_levels, ["comp00"])]
+        )
+        == factors
+    )
+    assert Skewing.get_factors(
         schedule=schedule,
         loop_levels=loop_levels,
         comps_skewed_loops=sample.tree.get_iterator_subtree_computations(("comp00", 0)),
+    ) == (1, 1)
+
+
+def test_get_factors_not_coprime(monkeypatch):
+    # the outer parallelism solution is not coprime, the inner one is used
+    assert CompilingService._parse_skewing_solver_result("2,4,1,2,None,None") == (
+        1,
+        2,
+    )
+    assert CompilingService._parse_skewing_solver_result("2,4,None,None,1,1") is None
+    assert CompilingService._parse_skewing_solver_result("2,4,3,3,1,1") is None
+
+    BaseConfig.init()
+    CompilingService._skewing_solver_cache.clear()
+    sample = test_utils.skewing_example()
+    schedule = Schedule(sample)
+    monkeypatch.setattr(
+        CompilingService,
+        "run_cpp_code",
+        lambda cpp_code, output_path: "2,4,None,None,1,1\n2,4,3,1,None,None\n",
+    )
+
+    assert CompilingService.call_skewing_solver_batch(
+        schedule,
+        [
+            (
+                sample.tree.get_iterator_levels([("comp00", 0), ("comp00", 1)]),
+                ["comp00"],
+            ),
+            (
+                sample.tree.get_iterator_levels([("comp00", 1), ("comp00", 2)]),
+                ["comp00"],
+            ),
+        ],
+    ) == [None, (3, 1)]
+    assert (
+        Skewing.get_factors(
+            schedule=schedule,
+            loop_levels=sample.tree.get_iterator_levels([("comp00", 0), ("comp00", 1)]),
+            comps_skewed_loops=["comp00"],
+        )
+        is None
     )
-    assert factors == (1, 1)
+    CompilingService._skewing_solver_cache.clear()
@@ -1,5 +1,8 @@
+import itertools
+
 from tiralib.tiramisu.schedule import Schedule
 from tiralib.tiramisu.tiramisu_actions.parallelization import Parallelization
+from tiralib.tiramisu.tiramisu_actions.tiramisu_action import TiramisuAction
 from tiralib.tiramisu.tiramisu_program import TiramisuProgram
 
 
@@ -7,27 +10,65 @@ def parallelize_first_legal_outermost(
     tiramisu_program: TiramisuProgram,
 ) -> Schedule:
     schedule = Schedule(tiramisu_program)
-    candidates_per_root = Parallelization.get_candidates(tiramisu_program.tree)
+    tree = tiramisu_program.tree
+    candidates_per_root = Parallelization.get_candidates(tree)
 
-    for root in tiramisu_program.tree.roots:
-        tmp_schedule = schedule.copy()
-        for candidate in candidates_per_root[tiramisu_program.tree.iterators[root].id]:
-            for node in candidate:
-                tmp_schedule.add_optimizations(
+    # each candidate is tried on its own
+    variants_per_root: list[list[list[TiramisuAction]]] = [
+        [
+            [
+                Parallelization(
                     [
-                        Parallelization(
-                            [
-                                (
-                                    node[0],
-                                    node[1],
-                                )
-                            ]
+                        (
+                            node[0],
+                            node[1],
                         )
-                    ]
+                    ],
+                    # order the computations by their absolute order
+                    comps=sorted(
+                        tree.get_iterator_subtree_computations(node),
+                        key=lambda comp: tree.computations_absolute_order[comp],
+                    ),
                 )
-            if tmp_schedule.is_legal():
-                schedule = tmp_schedule
-                break
+                for node in candidate
+            ]
+            for candidate in candidates_per_root[tree.iterators[root].id]
+        ]
+        for root in tree.roots
+    ]
+
+    # the candidates are only checked on top of the initial schedule, the
+    # combined schedule relies on the roots being independent: the
+    # parallelization picked for a root does not change the legality of the
+    # candidates of the other roots
+    legal_variants: list[list[TiramisuAction]] = []
+    if tiramisu_program.server:
+        # every check is a request to the server, stop at the first legal
+        # candidate of each root
+        for variants in variants_per_root:
+            for variant in variants:
+                tmp_schedule = schedule.copy()
+                tmp_schedule.add_optimizations(variant)
+                if tmp_schedule.is_legal():
+                    legal_variants.append(variant)
+                    break
+    else:
+        # the candidates of all the roots are checked in a single legality call
+        legalities = iter(
+            schedule.batch_is_legal(
+                [variant for variants in variants_per_root for variant in variants]
+            )
+        )
+
+        for variants in variants_per_root:
+            root_legalities = list(itertools.islice(legalities, len(variants)))
+            for variant, legality in zip(variants, root_legalities):
+                if legality:
+                    legal_variants.append(variant)
+                    break
+
+    for variant in legal_variants:
+        schedule.add_optimizations(variant)
 
     if not schedule.optims_list:
         return None
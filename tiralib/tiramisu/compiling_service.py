@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import math
 import os
 import re
 import subprocess
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Sequence, Tuple
 
 from tiralib.config import BaseConfig
+from tiralib.tiramisu.tiramisu_actions.parallelization import Parallelization
 from tiralib.tiramisu.tiramisu_tree import TiramisuTree
 
 if TYPE_CHECKING:
@@ -24,6 +27,14 @@ class CompilingService:
     to get the results Contains nothing but class methods
     """
 
+    # Maximal number of memoized skewing solver solutions
+    skewing_solver_cache_size: int = 4096
+    # Skewing solver solutions indexed by the digest of the legality code of
+    # the schedule, the levels of the skewed loops and their computations
+    _skewing_solver_cache: dict[
+        Tuple[str, Tuple[int, ...], Tuple[str, ...]], Tuple[int, int] | None
+    ] = {}
+
     @classmethod
     def compile_legality(cls, schedule: Schedule, with_ast: bool = False):
         """Compile and run legality of the schedule.
@@ -111,6 +122,102 @@ class CompilingService:
         )
         return cpp_code
 
+    @classmethod
+    def compile_parallelization_legality_batch(
+        cls,
+        schedule: Schedule,
+        variants: Sequence[Sequence[TiramisuAction]],
+    ) -> List[bool]:
+        """Compile and run the legality check of several parallelization
+        variants of a schedule at once.
+
+        Args:
+            schedule (Schedule): The schedule the variants extend
+            variants (Sequence[Sequence[TiramisuAction]]): The parallelizations
+                of each variant, already initialized for the schedule tree
+
+        Returns:
+            List[bool]: The legality of each variant, in the same order
+        """
+        assert BaseConfig.base_config
+
+        output_path = os.path.join(
+            BaseConfig.base_config.workspace,
+            f"{schedule.tiramisu_program.temp_files_identifier}_legality_batch",
+        )
+
+        cpp_code = cls.get_parallelization_batch_legality_code(schedule, variants)
+
+        logger.debug("Batch Legality Code: \n" + cpp_code)
+
+        result = cls.run_cpp_code(cpp_code=cpp_code, output_path=output_path)
+
+        legality_results = [line.strip() for line in result.strip().split("\n")]
+        if len(legality_results) != len(variants) or any(
+            legality_result not in ["0", "1"] for legality_result in legality_results
+        ):
+            raise Exception(f"Error in batch legality check: {result}")
+        return [legality_result == "1" for legality_result in legality_results]
+
+    @classmethod
+    def get_parallelization_batch_legality_code(
+        cls,
+        schedule: Schedule,
+        variants: Sequence[Sequence[TiramisuAction]],
+    ) -> str:
+        """Construct the code to check legality of several parallelization
+        variants of a schedule at once.
+
+        The schedule is applied and checked once. Tagging a loop as parallel
+        does not change the schedule of the function, so the variants are
+        only checked with `loop_parallelization_is_legal` and are never
+        applied.
+
+        Args:
+            schedule (Schedule): The schedule the variants extend
+            variants (Sequence[Sequence[TiramisuAction]]): The parallelizations
+                of each variant
+
+        Returns:
+            str: The code printing the legality of each variant on its own line
+        """
+        assert schedule.tiramisu_program.cpp_code
+
+        legality_check_lines = """
+    prepare_schedules_for_legality_checks(true);
+    perform_full_dependency_analysis();
+    bool is_legal=true;
+"""
+        for optim in schedule.optims_list:
+            legality_check_lines += "    " + optim.legality_check_string
+
+        legality_check_lines += """
+    prepare_schedules_for_legality_checks(true);
+    is_legal &= check_legality_of_function();
+"""
+        for variant in variants:
+            legality_check_lines += """
+    {
+    bool variant_is_legal=is_legal;
+"""
+            for optim in variant:
+                if not isinstance(optim, Parallelization):
+                    raise ValueError(
+                        f"Only parallelizations can be checked in a batch, got {optim}"
+                    )
+                legality_check_lines += (
+                    f"    variant_is_legal &= {optim.parallelization_legality_check};\n"
+                )
+
+            legality_check_lines += """    std::cout << variant_is_legal << std::endl;
+    }
+"""
+
+        cpp_code = schedule.tiramisu_program.cpp_code.replace(
+            schedule.tiramisu_program.code_gen_line, legality_check_lines
+        )
+        return cpp_code
+
     @classmethod
     def compile_annotations(cls, tiramisu_program: TiramisuProgram):
         """Compile and return the annotations of the program.
@@ -250,6 +357,9 @@ class CompilingService:
     ):
         """Call the skewing solver to generate the skewing code.
 
+        Solutions are memoized, calling the solver again with the same schedule,
+        loop levels and computations does not compile anything.
+
         Args:
             schedule (Schedule): The schedule to skew
             loop_levels (List[int]): The levels of the loops to skew
@@ -258,32 +368,104 @@ class CompilingService:
         Returns:
             Tuple[int, int]: The factors to skew the loops by
         """
+        return cls.call_skewing_solver_batch(
+            schedule, [(loop_levels, comps_skewed_loops)]
+        )[0]
+
+    @classmethod
+    def call_skewing_solver_batch(
+        cls,
+        schedule: Schedule,
+        skewing_requests: List[Tuple[List[int], List[str]]],
+    ) -> List[Tuple[int, int] | None]:
+        """Call the skewing solver for several pairs of loops at once.
+
+        All the requests that are not already memoized are solved by a single
+        generated program.
+
+        Args:
+            schedule (Schedule): The schedule to skew
+            skewing_requests (List[Tuple[List[int], List[str]]]): The levels of
+                the loops to skew and the computations of these loops for each
+                request
+
+        Returns:
+            List[Tuple[int, int] | None]: The factors to skew the loops by for
+                each request, None when the solver found no solution
+        """
         assert schedule.tiramisu_program
 
         if BaseConfig.base_config is None:
             raise Exception("The base config is not loaded yet")
         legality_cpp_code = cls.get_legality_code(schedule)
-        to_replace = re.findall(
-            r"std::cout << is_legal << std::endl;", legality_cpp_code
-        )[0]
-        header = """
-        function * fct = tiramisu::global::get_implicit_function();\n"""
-        legality_cpp_code = legality_cpp_code.replace(
-            "is_legal &= check_legality_of_function();", ""
-        )
-        legality_cpp_code = legality_cpp_code.replace("bool is_legal=true;", "")
-        legality_cpp_code = re.sub(
-            r"is_legal &= loop_parallelization_is_legal.*\n",
-            "",
-            legality_cpp_code,
-        )
-        legality_cpp_code = re.sub(
-            r"is_legal &= loop_unrolling_is_legal.*\n", "", legality_cpp_code
+
+        legality_code_digest = hashlib.sha256(legality_cpp_code.encode()).hexdigest()
+        cache_keys = [
+            (legality_code_digest, tuple(loop_levels), tuple(comps_skewed_loops))
+            for loop_levels, comps_skewed_loops in skewing_requests
+        ]
+        solutions = {
+            key: cls._skewing_solver_cache[key]
+            for key in cache_keys
+            if key in cls._skewing_solver_cache
+        }
+        missing_keys = list(
+            dict.fromkeys(key for key in cache_keys if key not in solutions)
         )
 
+        if missing_keys:
+            to_replace = re.findall(
+                r"std::cout << is_legal << std::endl;", legality_cpp_code
+            )[0]
+            header = """
+        function * fct = tiramisu::global::get_implicit_function();\n"""
+            legality_cpp_code = legality_cpp_code.replace(
+                "is_legal &= check_legality_of_function();", ""
+            )
+            legality_cpp_code = legality_cpp_code.replace("bool is_legal=true;", "")
+            legality_cpp_code = re.sub(
+                r"is_legal &= loop_parallelization_is_legal.*\n",
+                "",
+                legality_cpp_code,
+            )
+            legality_cpp_code = re.sub(
+                r"is_legal &= loop_unrolling_is_legal.*\n", "", legality_cpp_code
+            )
+
+            solver_lines = header
+            for _, loop_levels, comps_skewed_loops in missing_keys:
+                solver_lines += cls._get_skewing_solver_lines(
+                    list(loop_levels), list(comps_skewed_loops)
+                )
+
+            solver_code = legality_cpp_code.replace(to_replace, solver_lines)
+            logger.debug("Skewing Solver Code:\n" + solver_code)
+            output_path = os.path.join(
+                BaseConfig.base_config.workspace,
+                f"{schedule.tiramisu_program.temp_files_identifier}_skewing_solver",
+            )
+
+            result_str = cls.run_cpp_code(cpp_code=solver_code, output_path=output_path)
+            result_lines = result_str.strip().split("\n")
+            if len(result_lines) != len(missing_keys):
+                raise Exception(f"Error in skewing solver: {result_str}")
+
+            for key, result_line in zip(missing_keys, result_lines):
+                solutions[key] = cls._parse_skewing_solver_result(result_line)
+                if len(cls._skewing_solver_cache) >= cls.skewing_solver_cache_size:
+                    # evict the oldest solution
+                    del cls._skewing_solver_cache[next(iter(cls._skewing_solver_cache))]
+                cls._skewing_solver_cache[key] = solutions[key]
+
+        return [solutions[key] for key in cache_keys]
+
+    @classmethod
+    def _get_skewing_solver_lines(
+        cls, loop_levels: List[int], comps_skewed_loops: List[str]
+    ) -> str:
+        # Each call is in its own scope and prints its solutions on one line
         solver_lines = (
-            header
-            + "\n\tauto auto_skewing_result = fct->skewing_local_solver({"
+            "\n\t{\n\tauto auto_skewing_result = fct->skewing_local_solver({"
             + ", ".join([f"&{comp}" for comp in comps_skewed_loops])
             + "}"
             + ",{},{},1);\n".format(*loop_levels)
@@ -314,36 +496,31 @@ class CompilingService:
             std::cout << outer3.front().second;
         }else {
             std::cout << "None,None";
+        }
+        std::cout << std::endl;
         }
 
             """
+        return solver_lines
 
-        solver_code = legality_cpp_code.replace(to_replace, solver_lines)
-        logger.debug("Skewing Solver Code:\n" + solver_code)
-        output_path = os.path.join(
-            BaseConfig.base_config.workspace,
-            f"{schedule.tiramisu_program.temp_files_identifier}_skewing_solver",
-        )
-
-        result_str = cls.run_cpp_code(cpp_code=solver_code, output_path=output_path)
-        result_str = result_str.split(",")
+    @classmethod
+    def _parse_skewing_solver_result(cls, result_line: str) -> Tuple[int, int] | None:
+        result_str = result_line.strip().split(",")
 
         # Skewing Solver returns 3 solutions in form of tuples:
         # - the first tuple is for outer parallelism.
         # - second is for inner parallelism , and last one is for locality.
 
-        if result_str[0] != "None":
-            # Means we have a solution for outer parallelism
-            fac1 = int(result_str[0])
-            fac2 = int(result_str[1])
-            return fac1, fac2
-        if result_str[2] != "None":
-            # Means we have a solution for inner parallelism
-            fac1 = int(result_str[2])
-            fac2 = int(result_str[3])
-            return fac1, fac2
-        else:
-            return None
+        # Means we have a solution for outer parallelism, otherwise for
+        # inner parallelism. Factors that are not coprime give a degenerate
+        # transformation, the next solution is used instead
+        for index in (0, 2):
+            if result_str[index] != "None":
+                fac1 = int(result_str[index])
+                fac2 = int(result_str[index + 1])
+                if math.gcd(fac1, fac2) == 1:
+                    return fac1, fac2
+        return None
 
     @classmethod
     def get_schedule_code(
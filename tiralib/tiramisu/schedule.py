@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import ast
+import copy
 import re
-from copy import deepcopy
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Sequence
 
 from tiralib.tiramisu.compiling_service import CompilingService
 from tiralib.tiramisu.function_server import ServerExecutionFailedError
@@ -33,14 +33,14 @@ class Schedule:
         self.tiramisu_program = tiramisu_program
         self.optims_list: List[TiramisuAction] = []
         if tiramisu_program:
-            self.tree = deepcopy(tiramisu_program.tree)
+            self.tree = copy.deepcopy(tiramisu_program.tree)
         else:
             self.tree = None
         self.legality: bool | None = None
 
     def set_tiramisu_program(self, tiramisu_program: TiramisuProgram) -> None:
         self.tiramisu_program = tiramisu_program
-        self.tree = deepcopy(tiramisu_program.tree)
+        self.tree = copy.deepcopy(tiramisu_program.tree)
 
     def add_optimizations(self, list_optim_cmds: List[TiramisuAction]) -> None:
         """
@@ -207,6 +207,44 @@ class Schedule:
             self.tree = new_tree
         return self.legality
 
+    def batch_is_legal(
+        self, variants: Sequence[Sequence[TiramisuAction]]
+    ) -> List[bool]:
+        """
+        Checks the legality of several variants of the schedule, each variant
+        being the current schedule extended with a list of optimizations.
+        Without a server, variants made only of parallelizations are checked by
+        a single program so that the dependency analysis is only done once,
+        the other variants are checked one by one.
+
+        Parameters
+        ----------
+        `variants` : `Sequence[Sequence[TiramisuAction]]`
+            The optimizations to append to the schedule for each variant.
+
+        Returns
+        -------
+        List of booleans indicating if each variant is legal.
+        """
+        if not variants:
+            return []
+
+        if self.tiramisu_program.server or not all(
+            optim.is_parallelization() for variant in variants for optim in variant
+        ):
+            legalities: List[bool] = []
+            for variant in variants:
+                variant_schedule = self.copy()
+                variant_schedule.add_optimizations(list(variant))
+                legalities.append(variant_schedule.is_legal())
+            return legalities
+
+        for variant in variants:
+            for optim in variant:
+                optim.initialize_action_for_tree(self.tree)
+
+        return CompilingService.compile_parallelization_legality_batch(self, variants)
+
     def update_tree_from_isl_ast(self):
         """
         Updates the schedule tree from the isl ast.
@@ -442,9 +480,14 @@ class Schedule:
     def copy(self) -> Schedule:
         """
         Returns a copy of the schedule.
+
+        The schedule tree is shared with the copy instead of being rebuilt:
+        a schedule never modifies its tree in place, it replaces it whenever
+        an optimization changes its structure, so the two schedules only stop
+        sharing it once one of them gets a new tree.
         """
-        new_schedule = Schedule(self.tiramisu_program)
-        new_schedule.add_optimizations(self.optims_list)
+        new_schedule = copy.copy(self)
+        new_schedule.optims_list = list(self.optims_list)
         return new_schedule
 
     def __len__(self) -> int:
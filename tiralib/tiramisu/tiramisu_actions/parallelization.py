@@ -63,7 +63,9 @@ class Parallelization(TiramisuAction):
 
         self.str_representation = f"P(L{level},comps={self.comps})"
 
-        self.legality_check_string = f"prepare_schedules_for_legality_checks(true);\n    is_legal &= loop_parallelization_is_legal({level}, {{{', '.join([f'&{comp}' for comp in self.comps])}}});\n    {self.tiramisu_optim_str}"  # noqa: E501
+        self.parallelization_legality_check = f"loop_parallelization_is_legal({level}, {{{', '.join([f'&{comp}' for comp in self.comps])}}})"  # noqa: E501
+
+        self.legality_check_string = f"prepare_schedules_for_legality_checks(true);\n    is_legal &= {self.parallelization_legality_check};\n    {self.tiramisu_optim_str}"  # noqa: E501
 
     @classmethod
     def _get_candidates_of_node(
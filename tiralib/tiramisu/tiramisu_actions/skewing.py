@@ -5,7 +5,7 @@ import itertools
 from typing import TYPE_CHECKING, List, Tuple
 
 from tiralib.tiramisu.compiling_service import CompilingService
-from tiralib.tiramisu.tiramisu_iterator_node import IteratorIdentifier
+from tiralib.tiramisu.tiramisu_iterator_node import IteratorIdentifier, IteratorNode
 from tiralib.tiramisu.tiramisu_tree import TiramisuTree
 
 if TYPE_CHECKING:
@@ -82,9 +82,10 @@ class Skewing(TiramisuAction):
             self.iterators[1], tuple
         )
 
-        self.tiramisu_optim_str = ""
-        for comp in self.comps:
-            self.tiramisu_optim_str += f"{comp}.skew({self.iterators[0][1]}, {self.iterators[1][1]}, {self.factors[0]}, {self.factors[1]});\n"  # noqa: E501
+        skew_params = f"{self.iterators[0][1]}, {self.iterators[1][1]}, {self.factors[0]}, {self.factors[1]}"  # noqa: E501
+        self.tiramisu_optim_str = "".join(
+            f"{comp}.skew({skew_params});\n" for comp in self.comps
+        )
 
         self.str_representation = f"S(L{self.iterators[0][1]},L{self.iterators[1][1]},{self.factors[0]},{self.factors[1]},comps={self.comps})"  # noqa: E501
 
@@ -92,8 +93,26 @@ class Skewing(TiramisuAction):
 
     @classmethod
     def get_candidates(
-        cls, program_tree: TiramisuTree
+        cls,
+        program_tree: TiramisuTree,
+        already_parallel: set[IteratorIdentifier] | None = None,
     ) -> dict[IteratorIdentifier, list[Tuple[IteratorIdentifier, IteratorIdentifier]]]:
+        """Get the list of candidates for skewing.
+
+        Parameters:
+        ----------
+        `program_tree`: `TiramisuTree`
+            The Tiramisu tree of the program.
+        `already_parallel`: `set[IteratorIdentifier] | None`
+            Iterators that are already known to be legally parallelizable.
+            Skewing is only worth exploring to enable parallelism, so sections
+            whose outermost iterator is in this set are skipped.
+
+        Returns:
+        -------
+        `dict[IteratorIdentifier, list[Tuple[IteratorIdentifier, IteratorIdentifier]]]`
+            Dictionary of candidate pairs of iterators to skew for each root.
+        """
         candidates: dict[
             IteratorIdentifier, list[Tuple[IteratorIdentifier, IteratorIdentifier]]
         ] = {}
@@ -103,20 +122,29 @@ class Skewing(TiramisuAction):
         for root_id in candidate_sections:
             candidates[root_id] = []
             for section in candidate_sections[root_id]:
+                if already_parallel and section[0] in already_parallel:
+                    continue
                 # Only consider sections with more than one iterator
                 if len(section) > 1:
                     # Get all possible combinations of 2 successive iterators
+                    # skipping the ones where skewing would be degenerate
                     candidates[root_id].extend(
-                        [
-                            (
-                                comb[0],
-                                comb[1],
-                            )
-                            for comb in itertools.pairwise(section)
-                        ]
+                        pair
+                        for pair in itertools.pairwise(section)
+                        if not any(
+                            cls._has_single_iteration(program_tree.iterators[iterator])
+                            for iterator in pair
+                        )
                     )
         return candidates
 
+    @classmethod
+    def _has_single_iteration(cls, iterator: IteratorNode) -> bool:
+        return (
+            iterator.has_integer_bounds()
+            and iterator.upper_bound - iterator.lower_bound <= 1  # type: ignore
+        )
+
     @classmethod
     def get_factors(
         cls,
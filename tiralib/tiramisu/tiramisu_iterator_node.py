@@ -1,9 +1,20 @@
-from typing import Tuple
+from typing import Any, Tuple
 
 IteratorIdentifier = Tuple[str, int]
 
 
 class IteratorNode:
+    __slots__ = (
+        "name",
+        "id",
+        "parent_iterator",
+        "lower_bound",
+        "upper_bound",
+        "child_iterators",
+        "computations_list",
+        "level",
+    )
+
     def __init__(
         self,
         name: str,
@@ -24,6 +35,22 @@ class IteratorNode:
         self.computations_list = computations_list
         self.level = level
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> "IteratorNode":
+        # identifiers, names and bounds are immutable, only the lists need
+        # to be duplicated
+        node_copy = IteratorNode(
+            name=self.name,
+            parent_iterator=self.parent_iterator,
+            lower_bound=self.lower_bound,
+            upper_bound=self.upper_bound,
+            child_iterators=list(self.child_iterators),
+            computations_list=list(self.computations_list),
+            level=self.level,
+            id=self.id,
+        )
+        memo[id(self)] = node_copy
+        return node_copy
+
     def add_child(self, child: IteratorIdentifier) -> None:
         self.child_iterators.append(child)
 
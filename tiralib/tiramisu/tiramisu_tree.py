@@ -1,4 +1,7 @@
+import copy
 import re
+import sys
+from collections import deque
 from typing import Any, Tuple
 
 from tiralib.tiramisu.tiramisu_iterator_node import (
@@ -25,17 +28,83 @@ class TiramisuTree:
         list of names of the computations in the Tiramisu program.
     """
 
+    __slots__ = (
+        "roots",
+        "iterators",
+        "computations",
+        "computations_absolute_order",
+        "_sections_cache",
+        "_subtree_comps_cache",
+        "_children",
+        "_comps_of",
+    )
+
     def __init__(self) -> None:
         self.roots: list[IteratorIdentifier] = []
         self.iterators: dict[IteratorIdentifier, IteratorNode] = {}
         self.computations: list[str] = []
         self.computations_absolute_order: dict[str, int] = {}
 
+        # Memoized traversal results, cleared whenever the tree is mutated
+        self._sections_cache: (
+            dict[IteratorIdentifier, list[list[IteratorIdentifier]]] | None
+        ) = None
+        self._subtree_comps_cache: dict[IteratorIdentifier, list[str]] = {}
+        # flat children/computations tables read by the traversals instead
+        # of going through the IteratorNode objects
+        self._children: (
+            dict[IteratorIdentifier, tuple[IteratorIdentifier, ...]] | None
+        ) = None
+        self._comps_of: dict[IteratorIdentifier, tuple[str, ...]] | None = None
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "TiramisuTree":
+        # only the structure is copied, the memoized traversals of the copy
+        # are rebuilt on demand
+        tree_copy = TiramisuTree()
+        memo[id(self)] = tree_copy
+        tree_copy.roots = list(self.roots)
+        tree_copy.iterators = {
+            iterator_id: copy.deepcopy(iterator, memo)
+            for iterator_id, iterator in self.iterators.items()
+        }
+        tree_copy.computations = list(self.computations)
+        tree_copy.computations_absolute_order = dict(self.computations_absolute_order)
+        return tree_copy
+
     def add_root(self, root: IteratorIdentifier) -> None:
         self.roots.append(root)
+        self.invalidate_caches()
 
     def add_computation(self, comp: str) -> None:
         self.computations.append(comp)
+        self.invalidate_caches()
+
+    def invalidate_caches(self) -> None:
+        """
+        Drops the memoized traversal results. Must be called after any
+        in-place modification of the tree structure.
+        """
+        self._sections_cache = None
+        self._subtree_comps_cache.clear()
+        self._children = None
+        self._comps_of = None
+
+    def _get_adjacency(
+        self,
+    ) -> tuple[
+        dict[IteratorIdentifier, tuple[IteratorIdentifier, ...]],
+        dict[IteratorIdentifier, tuple[str, ...]],
+    ]:
+        if self._children is None or self._comps_of is None:
+            self._children = {
+                iterator_id: tuple(node.child_iterators)
+                for iterator_id, node in self.iterators.items()
+            }
+            self._comps_of = {
+                iterator_id: tuple(node.computations_list)
+                for iterator_id, node in self.iterators.items()
+            }
+        return self._children, self._comps_of
 
     @classmethod
     def from_annotations(cls, annotations: dict[str, Any]) -> "TiramisuTree":
@@ -56,8 +125,10 @@ class TiramisuTree:
 
         iterators = annotations["iterators"]
 
+        # names are interned so that comparing identifiers built from them
+        # short-circuits on identity during dictionary lookups
         tiramisu_space.computations_absolute_order = {
-            comp: annotations["computations"][comp]["absolute_order"]
+            sys.intern(comp): annotations["computations"][comp]["absolute_order"]
             for comp in annotations["computations"]
         }
 
@@ -70,19 +141,16 @@ class TiramisuTree:
             )
         ]
 
+        # the id of an iterator is its position in the iterators of the first
+        # computation (in absolute order) that uses it
         iterator_name_to_id: dict[str, IteratorIdentifier] = {}
-        for iterator in iterators:
-            for computation in tiramisu_space.computations:
-                # get index of the iterator in the computation iterators
-                comp_iterators: list[str] = annotations["computations"][computation][
-                    "iterators"
-                ]
-                try:
-                    iterator_index = comp_iterators.index(iterator)
-                except ValueError:
-                    continue
-                iterator_name_to_id[iterator] = (computation, iterator_index)
-                break
+        for computation in tiramisu_space.computations:
+            comp_iterators: list[str] = annotations["computations"][computation][
+                "iterators"
+            ]
+            for iterator_index, iterator in enumerate(comp_iterators):
+                if iterator not in iterator_name_to_id:
+                    iterator_name_to_id[iterator] = (computation, iterator_index)
 
         for iterator in iterators:
             iterator_id = iterator_name_to_id[iterator]
@@ -120,7 +188,7 @@ class TiramisuTree:
                 upper_bound = iterators[iterator]["upper_bound"]
 
             tiramisu_space.iterators[iterator_id] = IteratorNode(
-                name=iterator,
+                name=sys.intern(iterator),
                 id=iterator_id,
                 lower_bound=lower_bound,
                 upper_bound=upper_bound,
@@ -170,6 +238,7 @@ class TiramisuTree:
                     _,
                 ) = str_line.split("|")
                 iterator_level = int(iterator_level_str)
+                lower_bound: int | str
                 try:
                     lower_bound = int(lower_bound_str)
                 except ValueError:
@@ -197,11 +266,12 @@ class TiramisuTree:
                     )
                 else:
                     iterator_duplicates[iterator_name] = 0
+                iterator_name = sys.intern(iterator_name)
 
                 first_comp: str = ""
                 for j in range(line_idx + 1, len(isl_ast_string_list)):
                     if "|computation|" in isl_ast_string_list[j]:
-                        first_comp = isl_ast_string_list[j].split("|")[2]
+                        first_comp = sys.intern(isl_ast_string_list[j].split("|")[2])
                         break
                 iterator_id = (first_comp, iterator_level)
                 name_to_iterator_identifier[iterator_name] = iterator_id
@@ -235,6 +305,7 @@ class TiramisuTree:
 
             elif "|computation|" in str_line:
                 level_str, _, comp_name = str_line.split("|")
+                comp_name = sys.intern(comp_name)
                 line_idx = int(level_str)
                 tiramisu_tree.computations.append(comp_name)
 
@@ -263,7 +334,7 @@ class TiramisuTree:
             + repr(self.iterators[node_id])
             + "\n"
         )
-        comps_and_iterators = [
+        comps_and_iterators: list[str | IteratorIdentifier] = [
             comp for comp in self.iterators[node_id].computations_list
         ]
         comps_and_iterators += [
@@ -305,37 +376,47 @@ class TiramisuTree:
         `candidate_sections`: `dict[IteratorIdentifier, list[list[IteratorIdentifier]]]`
             Dictionary with lists of candidate sections for each root iterator.
         """
+        if self._sections_cache is None:
+            self._sections_cache = self._compute_candidate_sections()
+
+        # callers are free to modify the returned lists
+        return {
+            root: [list(section) for section in sections]
+            for root, sections in self._sections_cache.items()
+        }
 
+    def _compute_candidate_sections(
+        self,
+    ) -> dict[IteratorIdentifier, list[list[IteratorIdentifier]]]:
         candidate_sections: dict[
             IteratorIdentifier, list[list[IteratorIdentifier]]
         ] = {}
         for root in self.roots:
-            nodes_to_visit = [root]
+            # breadth-first walk over the heads of the sections
+            nodes_to_visit = deque([root])
             list_candidate_sections: list[list[IteratorIdentifier]] = []
-            for node in nodes_to_visit:
+            while nodes_to_visit:
+                node = nodes_to_visit.popleft()
                 candidate_section, new_nodes_to_visit = self._get_section_of_node(node)
                 list_candidate_sections.append(candidate_section)
                 nodes_to_visit.extend(new_nodes_to_visit)
-            candidate_sections[self.iterators[root].id] = list_candidate_sections
+            candidate_sections[root] = list_candidate_sections
         return candidate_sections
 
     def _get_section_of_node(
         self, node_id: IteratorIdentifier
-    ) -> Tuple[list[IteratorIdentifier], list[IteratorIdentifier]]:
-        candidate_section = [self.iterators[node_id].id]
-        current_node = self.iterators[node_id]
+    ) -> Tuple[list[IteratorIdentifier], tuple[IteratorIdentifier, ...]]:
+        children, comps_of = self._get_adjacency()
+        candidate_section = [node_id]
+        current_node_id = node_id
 
         while (
-            len(current_node.child_iterators) == 1
-            and len(current_node.computations_list) == 0
+            len(children[current_node_id]) == 1 and len(comps_of[current_node_id]) == 0
         ):
-            next_node_name = current_node.child_iterators[0]
-            current_node = self.iterators[next_node_name]
-            candidate_section.append(current_node.id)
+            current_node_id = children[current_node_id][0]
+            candidate_section.append(current_node_id)
 
-        if current_node.child_iterators:
-            return candidate_section, current_node.child_iterators
-        return candidate_section, []
+        return candidate_section, children[current_node_id]
 
     def get_iterator_subtree_computations(
         self, candidate_node_id: IteratorIdentifier
@@ -355,14 +436,26 @@ class TiramisuTree:
         `list`
             list of computations impacted by the node
         """
+        if candidate_node_id not in self._subtree_comps_cache:
+            self._subtree_comps_cache[candidate_node_id] = (
+                self._compute_iterator_subtree_computations(candidate_node_id)
+            )
 
-        computations: list[str] = []
-        candidate_node = self.iterators[candidate_node_id]
-
-        computations += candidate_node.computations_list
+        # callers are free to modify the returned list
+        return list(self._subtree_comps_cache[candidate_node_id])
 
-        for child in candidate_node.child_iterators:
-            computations += self.get_iterator_subtree_computations(child)
+    def _compute_iterator_subtree_computations(
+        self, candidate_node_id: IteratorIdentifier
+    ) -> list[str]:
+        # iterative pre-order walk, children are pushed in reverse so that
+        # they are popped in their original order
+        children, comps_of = self._get_adjacency()
+        computations: list[str] = []
+        stack = [candidate_node_id]
+        while stack:
+            node_id = stack.pop()
+            computations.extend(comps_of[node_id])
+            stack.extend(reversed(children[node_id]))
 
         return computations
 
@@ -372,7 +465,8 @@ class TiramisuTree:
         """
         This function returns the levels of the iterators in the computation
         """
-        return [self.iterators[iterator].level for iterator in iterators_list]
+        iterators = self.iterators
+        return [iterators[iterator].level for iterator in iterators_list]
 
     def get_root_of_node(self, iterator_id: IteratorIdentifier) -> IteratorIdentifier:
         # Get the root node of the iterator
@@ -385,7 +479,7 @@ class TiramisuTree:
 
     def get_iterator_of_computation(
         self, computation_name: str, level: int | None = None
-    ):
+    ) -> IteratorNode:
         """
         This function returns the iterator of the computation
         """
@@ -421,6 +515,7 @@ class TiramisuTree:
     def set_iterator_ids(self) -> None:
         for iterator in self.iterators.values():
             iterator.id = self.get_iterator_id_from_name(iterator.name)
+        self.invalidate_caches()
 
     def __repr__(self) -> str:
         representation = ""
@@ -451,7 +546,7 @@ class TiramisuTree:
         representation += (
             f"{iterator.name}|iterator|{iterator.lower_bound}|{upper_bound_str}|1\n"
         )
-        comps_and_iterators = [
+        comps_and_iterators: list[str | IteratorIdentifier] = [
             comp for comp in self.iterators[node_id].computations_list
         ]
         comps_and_iterators += [